@@ -5,34 +5,71 @@ import sys
 import os
 from dotenv import load_dotenv
 from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import QThreadPool
 from ui.main_window import MainWindow
 from services.speech_to_text import SpeechToTextService
 from services.summarizer import SummarizerService
+from services.lazy_service import LazyService
 
 
-def check_environment():
+REQUIRED_VARS = [
+    'GOOGLE_APPLICATION_CREDENTIALS',
+    'GOOGLE_CLOUD_PROJECT_ID'
+]
+
+_env_cache = None
+
+
+def get_env() -> dict:
+    """Read required environment variables once and cache them"""
+    global _env_cache
+    if _env_cache is None:
+        _env_cache = {var: os.environ.get(var) for var in REQUIRED_VARS}
+    return _env_cache
+
+
+def clear_env_cache():
+    """Forget cached environment values (used by tests)"""
+    global _env_cache
+    _env_cache = None
+
+
+def check_environment(env: dict):
     """Check if all required environment variables are set"""
-    required_vars = [
-        'GOOGLE_APPLICATION_CREDENTIALS',
-        'GOOGLE_CLOUD_PROJECT_ID'
-    ]
-    
     missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
+    for var in REQUIRED_VARS:
+        if not env.get(var):
             missing_vars.append(var)
     
     if missing_vars:
         return False, missing_vars
     
     # Check if credentials file exists
-    creds_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+    creds_path = env.get('GOOGLE_APPLICATION_CREDENTIALS')
     if creds_path and not os.path.exists(creds_path):
         return False, [f"Credentials file not found: {creds_path}"]
     
     return True, []
 
 
+def show_startup_error(error: str):
+    """Show the startup error dialog with setup guidance"""
+    msg = QMessageBox()
+    msg.setIcon(QMessageBox.Icon.Critical)
+    msg.setWindowTitle("Startup Error")
+    msg.setText("Failed to start application!")
+    msg.setInformativeText(error)
+    msg.setDetailedText(
+        "Make sure you have:\n"
+        "1. Set up Google Cloud credentials correctly\n"
+        "2. Enabled Speech-to-Text API\n"
+        "3. Enabled Vertex AI API\n"
+        "4. Set GOOGLE_CLOUD_PROJECT_ID\n\n"
+        "See README.md for detailed setup instructions."
+    )
+    msg.exec()
+
+
 def main():
     """Main application entry point"""
     # Load environment variables
@@ -43,7 +80,8 @@ def main():
     app.setApplicationName("Audio Notes")
     
     # Check environment
-    env_ok, missing = check_environment()
+    env = get_env()
+    env_ok, missing = check_environment(env)
     if not env_ok:
         msg = QMessageBox()
         msg.setIcon(QMessageBox.Icon.Critical)
@@ -58,35 +96,43 @@ def main():
         sys.exit(1)
     
     try:
-        # Initialize services
-        stt_service = SpeechToTextService()
-        summarizer_service = SummarizerService(
-            project_id=os.getenv('GOOGLE_CLOUD_PROJECT_ID'),
-            credentials_path=os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+        # Services are built in the background so the window can paint first
+        stt_service = LazyService(SpeechToTextService)
+        summarizer_service = LazyService(
+            lambda: SummarizerService(
+                project_id=env['GOOGLE_CLOUD_PROJECT_ID'],
+                credentials_path=env['GOOGLE_APPLICATION_CREDENTIALS']
+            )
         )
         
         # Create and show main window
         window = MainWindow(stt_service, summarizer_service)
         window.show()
+        app.processEvents()
+        
+        # A client that fails to initialize is a startup error, reported
+        # once even if both fail
+        startup_failed = []
+        
+        def on_init_failed(error):
+            if not startup_failed:
+                startup_failed.append(error)
+                show_startup_error(error)
+                app.exit(1)
+        
+        stt_service.signals.failed.connect(on_init_failed)
+        summarizer_service.signals.failed.connect(on_init_failed)
+        
+        # Initialize both cloud clients concurrently
+        pool = QThreadPool.globalInstance()
+        pool.start(stt_service._init_real)
+        pool.start(summarizer_service._init_real)
         
         # Run application
         sys.exit(app.exec())
         
     except Exception as e:
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Icon.Critical)
-        msg.setWindowTitle("Startup Error")
-        msg.setText("Failed to start application!")
-        msg.setInformativeText(str(e))
-        msg.setDetailedText(
-            "Make sure you have:\n"
-            "1. Set up Google Cloud credentials correctly\n"
-            "2. Enabled Speech-to-Text API\n"
-            "3. Enabled Vertex AI API\n"
-            "4. Set GOOGLE_CLOUD_PROJECT_ID\n\n"
-            "See README.md for detailed setup instructions."
-        )
-        msg.exec()
+        show_startup_error(str(e))
         sys.exit(1)
 
 
@@ -6,6 +6,11 @@ from datetime import datetime
 from typing import Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class Note:
@@ -29,9 +34,13 @@ class Note:
     
     def to_json(self) -> str:
         """Convert note to JSON string"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(self.to_dict(), indent=2)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'Note':
         """Create note from JSON string"""
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(json_str))
         return cls.from_dict(json.loads(json_str))
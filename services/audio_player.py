@@ -2,57 +2,117 @@
 Audio playback service
 """
 import os
+import hashlib
 import pygame
 import subprocess
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from mutagen import File as MutagenFile
 
 
+# Bytes of the source file hashed into the playback cache fingerprint
+FINGERPRINT_BYTES = 64 * 1024
+
+
+@lru_cache(maxsize=512)
+def _cached_duration(audio_path: str, mtime_ns: int, size: int) -> float:
+    """Read audio duration; cached per (path, mtime, size)"""
+    # Try using mutagen first (more reliable)
+    audio_file = MutagenFile(audio_path)
+    if audio_file is not None and hasattr(audio_file.info, 'length'):
+        return float(audio_file.info.length)
+    
+    # Fallback to ffprobe
+    result = subprocess.run([
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'json',
+        audio_path
+    ], capture_output=True, text=True, check=True)
+    
+    data = json.loads(result.stdout)
+    return float(data['format']['duration'])
+
+
+@lru_cache(maxsize=512)
+def _fingerprint(audio_path: str, mtime_ns: int, size: int) -> str:
+    """Fast content fingerprint: hash of the file head plus its size and mtime"""
+    digest = hashlib.sha1()
+    with open(audio_path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_BYTES))
+    digest.update(f"{size}:{mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _cached_playback_path(audio_path: str, mtime_ns: int, size: int, cache_dir: str) -> str:
+    """Convert audio file to MP3 for playback if needed, reusing the on-disk cache"""
+    file_ext = os.path.splitext(audio_path)[1].lower()
+    
+    # Pygame supports these formats directly
+    supported_formats = ['.mp3', '.ogg', '.wav']
+    
+    if file_ext in supported_formats:
+        return audio_path
+    
+    # Converted files are content-addressed: cache/<fp[:2]>/<fp>.mp3
+    fingerprint = _fingerprint(audio_path, mtime_ns, size)
+    mp3_dir = os.path.join(cache_dir, fingerprint[:2])
+    mp3_path = os.path.join(mp3_dir, f"{fingerprint}.mp3")
+    
+    # Check if already converted; checked on every load because the cache
+    # sweep may evict files while the app runs
+    try:
+        # Refresh access time for the cache eviction sweep
+        os.utime(mp3_path, (time.time(), os.stat(mp3_path).st_mtime))
+        print(f"Using existing converted file: {mp3_path}")
+        return mp3_path
+    except FileNotFoundError:
+        pass
+    
+    print(f"Converting {file_ext} to MP3 for playback...")
+    os.makedirs(mp3_dir, exist_ok=True)
+    tmp_path = os.path.join(mp3_dir, f"{fingerprint}.tmp.mp3")
+    try:
+        result = subprocess.run([
+            'ffmpeg', '-i', audio_path,
+            '-vn',  # No video
+            '-ar', '44100',  # Sample rate
+            '-ac', '2',  # Stereo
+            '-b:a', '192k',  # Bitrate
+            '-y',  # Overwrite
+            tmp_path
+        ], check=True, capture_output=True)
+        # Publish atomically so an interrupted conversion is never a cache hit
+        os.replace(tmp_path, mp3_path)
+        print(f"Conversion successful: {mp3_path}")
+        return mp3_path
+    except (subprocess.CalledProcessError, OSError) as e:
+        stderr = getattr(e, 'stderr', None)
+        error_msg = stderr.decode() if stderr else str(e)
+        print(f"Conversion failed: {error_msg}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise Exception(f"Failed to convert audio for playback: {error_msg}")
+
+
 class AudioPlayer:
     """Service for playing audio files"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: str = os.path.join("notes_data", "cache")):
         pygame.mixer.init()
+        self.cache_dir = cache_dir
         self.current_file = None
         self.converted_file = None
         self.is_playing = False
         self.is_paused = False
     
-    def _convert_for_playback(self, audio_path: str) -> str:
+    def _convert_for_playback(self, audio_path: str, st: os.stat_result = None) -> str:
         """Convert audio file to MP3 for playback if needed"""
-        file_ext = os.path.splitext(audio_path)[1].lower()
-        
-        # Pygame supports these formats directly
-        supported_formats = ['.mp3', '.ogg', '.wav']
-        
-        if file_ext in supported_formats:
-            return audio_path
-        
-        # Convert to MP3 for playback
-        mp3_path = audio_path.rsplit('.', 1)[0] + '_playback.mp3'
-        
-        # Check if already converted
-        if os.path.exists(mp3_path):
-            print(f"Using existing converted file: {mp3_path}")
-            return mp3_path
-        
-        print(f"Converting {file_ext} to MP3 for playback...")
-        try:
-            result = subprocess.run([
-                'ffmpeg', '-i', audio_path,
-                '-vn',  # No video
-                '-ar', '44100',  # Sample rate
-                '-ac', '2',  # Stereo
-                '-b:a', '192k',  # Bitrate
-                '-y',  # Overwrite
-                mp3_path
-            ], check=True, capture_output=True)
-            print(f"Conversion successful: {mp3_path}")
-            return mp3_path
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
-            print(f"Conversion failed: {error_msg}")
-            raise Exception(f"Failed to convert audio for playback: {error_msg}")
+        if st is None:
+            st = os.stat(audio_path)
+        return _cached_playback_path(audio_path, st.st_mtime_ns, st.st_size, self.cache_dir)
     
     def load(self, audio_path: str):
         """Load an audio file"""
@@ -60,19 +120,13 @@ class AudioPlayer:
             print(f"Loading audio: {audio_path}")
             
             # Check if file exists
-            if not os.path.exists(audio_path):
+            try:
+                st = os.stat(audio_path)
+            except FileNotFoundError:
                 raise Exception(f"Audio file not found: {audio_path}")
             
-            # Clean up previous converted file
-            if self.converted_file and self.converted_file != self.current_file:
-                if os.path.exists(self.converted_file):
-                    try:
-                        os.remove(self.converted_file)
-                    except:
-                        pass
-            
             # Convert if needed
-            playback_path = self._convert_for_playback(audio_path)
+            playback_path = self._convert_for_playback(audio_path, st)
             
             print(f"Loading into pygame: {playback_path}")
             
@@ -120,37 +174,27 @@ class AudioPlayer:
         pygame.mixer.music.stop()
         self.is_playing = False
         self.is_paused = False
-        
-        # Clean up converted file when stopping
-        if self.converted_file and os.path.exists(self.converted_file):
-            try:
-                # Don't delete immediately as pygame might still be using it
-                pass
-            except:
-                pass
     
     def get_duration(self, audio_path: str) -> float:
         """Get duration of audio file in seconds"""
         try:
-            # Try using mutagen first (more reliable)
-            audio_file = MutagenFile(audio_path)
-            if audio_file is not None and hasattr(audio_file.info, 'length'):
-                return float(audio_file.info.length)
-            
-            # Fallback to ffprobe
-            result = subprocess.run([
-                'ffprobe', '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'json',
-                audio_path
-            ], capture_output=True, text=True, check=True)
-            
-            data = json.loads(result.stdout)
-            return float(data['format']['duration'])
+            st = os.stat(audio_path)
+            return _cached_duration(audio_path, st.st_mtime_ns, st.st_size)
         except Exception as e:
             print(f"Error getting duration: {e}")
             return 0.0
     
+    def get_durations(self, audio_paths: list) -> dict:
+        """Get durations for many audio files at once, probing them in parallel"""
+        unique_paths = list(dict.fromkeys(audio_paths))
+        if not unique_paths:
+            return {}
+        
+        workers = min(len(unique_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            durations = executor.map(self.get_duration, unique_paths)
+            return dict(zip(unique_paths, durations))
+    
     def set_volume(self, volume: float):
         """Set volume (0.0 to 1.0)"""
         pygame.mixer.music.set_volume(volume)
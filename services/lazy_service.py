@@ -0,0 +1,33 @@
+"""
+Deferred initialization for cloud services
+"""
+from concurrent.futures import Future
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class LazyServiceSignals(QObject):
+    """Signals for LazyService"""
+    failed = pyqtSignal(str)  # error message
+
+
+class LazyService:
+    """Proxy that builds a service in the background and blocks only on first use"""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._future = Future()
+        self.signals = LazyServiceSignals()
+
+    def _init_real(self):
+        """Construct the wrapped service (runs on a worker thread)"""
+        if not self._future.set_running_or_notify_cancel():
+            return
+        try:
+            self._future.set_result(self._factory())
+        except Exception as e:
+            self._future.set_exception(e)
+            self.signals.failed.emit(str(e))
+
+    def __getattr__(self, name):
+        # Only reached for attributes the proxy itself doesn't define
+        return getattr(self._future.result(), name)
@@ -4,24 +4,91 @@ Google Cloud Speech-to-Text integration
 import os
 import subprocess
 import time
-from google.cloud import speech
-from google.cloud import storage
+import wave
+
+
+# Resumable upload chunk size for GCS (must be a multiple of 256 KiB)
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Audio longer than this (seconds) is too long for a single streaming session
+STREAMING_MAX_DURATION = 300
+
+# Bytes per streaming request: 100 ms of 16 kHz mono 16-bit audio
+STREAMING_CHUNK_SIZE = 3200
+
+# Languages considered alongside en-US for automatic language detection
+ALTERNATIVE_LANGUAGE_CODES = (
+    "uk-UA",  # Ukrainian
+    "ru-RU",  # Russian
+    "es-ES",  # Spanish
+    "fr-FR",  # French
+    "de-DE",  # German
+    "it-IT",  # Italian
+    "pt-PT",  # Portuguese
+    "pl-PL",  # Polish
+    "ja-JP",  # Japanese
+    "zh-CN",  # Chinese (Simplified)
+    "ko-KR",  # Korean
+    "ar-SA",  # Arabic
+    "hi-IN",  # Hindi
+    "tr-TR",  # Turkish
+)
 
 
 class SpeechToTextService:
     """Service for transcribing audio using Google Cloud Speech-to-Text"""
     
     def __init__(self):
+        # Imported lazily: the Google Cloud client pulls in gRPC and protobuf
+        from google.cloud import speech
+        self._speech = speech
         self.client = speech.SpeechClient()
         self.storage_client = None
         self.bucket_name = None
+        self._bucket = None
         self.project_id = os.getenv('GOOGLE_CLOUD_PROJECT_ID')
+        
+        # Automatic language detection config, shared by every "auto" request
+        self._auto_config = speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            # Specify multiple language alternatives for auto-detection
+            language_code="en-US",  # Primary language
+            alternative_language_codes=ALTERNATIVE_LANGUAGE_CODES,
+            enable_automatic_punctuation=True,
+            enable_word_time_offsets=False,
+        )
+    
+    def _get_config(self, language_code: str):
+        """Get the recognition config for a language code ("auto" for detection)"""
+        if language_code == "auto":
+            return self._auto_config
+        
+        # Use specified language
+        return self._speech.RecognitionConfig(
+            encoding=self._speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            language_code=language_code,
+            enable_automatic_punctuation=True,
+            enable_word_time_offsets=False,
+        )
+    
+    def _is_linear16_mono_16k(self, audio_path: str) -> bool:
+        """Check from the WAV header whether the file is 16 kHz mono 16-bit PCM"""
+        try:
+            with wave.open(audio_path, 'rb') as wf:
+                return (
+                    wf.getframerate() == 16000 and
+                    wf.getnchannels() == 1 and
+                    wf.getsampwidth() == 2
+                )
+        except (wave.Error, EOFError):
+            return False
     
     def _convert_to_wav(self, audio_path: str) -> str:
         """Convert audio file to WAV format for processing"""
         file_ext = os.path.splitext(audio_path)[1].lower()
         
-        if file_ext == '.wav':
+        # Skip ffmpeg entirely when the file is already in the target format
+        if file_ext == '.wav' and self._is_linear16_mono_16k(audio_path):
             return audio_path
         
         # Convert to WAV using ffmpeg
@@ -53,7 +120,12 @@ class SpeechToTextService:
     
     def _setup_gcs_bucket(self):
         """Setup Google Cloud Storage bucket for long audio files"""
+        # The bucket is verified once and reused for the process lifetime
+        if self._bucket is not None:
+            return self._bucket
+        
         if not self.storage_client:
+            from google.cloud import storage
             self.storage_client = storage.Client(project=self.project_id)
         
         # Use project-based bucket name
@@ -70,6 +142,7 @@ class SpeechToTextService:
                 location='us-central1'
             )
         
+        self._bucket = bucket
         return bucket
     
     def _upload_to_gcs(self, audio_path: str) -> str:
@@ -80,9 +153,15 @@ class SpeechToTextService:
         filename = os.path.basename(audio_path)
         blob_name = f"audio/{int(time.time())}_{filename}"
         
-        # Upload file
+        # Upload file as a chunked resumable upload
         blob = bucket.blob(blob_name)
-        blob.upload_from_filename(audio_path)
+        blob.chunk_size = GCS_UPLOAD_CHUNK_SIZE
+        with open(audio_path, 'rb') as audio_file:
+            blob.upload_from_file(
+                audio_file,
+                size=os.path.getsize(audio_path),
+                content_type='audio/wav'
+            )
         
         # Return GCS URI
         gcs_uri = f"gs://{self.bucket_name}/{blob_name}"
@@ -116,51 +195,20 @@ class SpeechToTextService:
             # Check audio duration
             duration = self._get_audio_duration(wav_path)
             
-            # Use long-running recognition for audio longer than 55 seconds
+            # Audio longer than 55 seconds is streamed from disk, or sent through
+            # GCS with long-running recognition if it exceeds the streaming limit
             if duration > 55:
+                if duration < STREAMING_MAX_DURATION:
+                    return self._transcribe_streaming(wav_path, language_code)
                 return self._transcribe_long_audio(wav_path, language_code)
             
             # Use synchronous recognition for short audio
-            # Read audio file
+            # Read audio file straight into the request; the protobuf keeps its
+            # own copy, so the raw bytes are not held for the whole call
             with open(wav_path, 'rb') as audio_file:
-                content = audio_file.read()
-            
-            # Configure recognition with automatic language detection
-            audio = speech.RecognitionAudio(content=content)
+                audio = self._speech.RecognitionAudio(content=audio_file.read())
             
-            if language_code == "auto":
-                # Use automatic language detection with multiple language alternatives
-                config = speech.RecognitionConfig(
-                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                    # Specify multiple language alternatives for auto-detection
-                    language_code="en-US",  # Primary language
-                    alternative_language_codes=[
-                        "uk-UA",  # Ukrainian
-                        "ru-RU",  # Russian
-                        "es-ES",  # Spanish
-                        "fr-FR",  # French
-                        "de-DE",  # German
-                        "it-IT",  # Italian
-                        "pt-PT",  # Portuguese
-                        "pl-PL",  # Polish
-                        "ja-JP",  # Japanese
-                        "zh-CN",  # Chinese (Simplified)
-                        "ko-KR",  # Korean
-                        "ar-SA",  # Arabic
-                        "hi-IN",  # Hindi
-                        "tr-TR",  # Turkish
-                    ],
-                    enable_automatic_punctuation=True,
-                    enable_word_time_offsets=False,
-                )
-            else:
-                # Use specified language
-                config = speech.RecognitionConfig(
-                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                    language_code=language_code,
-                    enable_automatic_punctuation=True,
-                    enable_word_time_offsets=False,
-                )
+            config = self._get_config(language_code)
             
             # Perform transcription
             response = self.client.recognize(config=config, audio=audio)
@@ -183,6 +231,117 @@ class SpeechToTextService:
                 os.remove(wav_path)
             return f"Error during transcription: {str(e)}"
     
+    def _transcribe_streaming(self, audio_path: str, language_code: str = "auto") -> str:
+        """
+        Transcribe medium-length audio with streaming recognition from a local file
+        Avoids the GCS upload and batch job used for long audio
+        
+        Args:
+            audio_path: Path to a 16 kHz mono 16-bit WAV file
+            language_code: Language code (default: "auto" for automatic detection)
+            
+        Returns:
+            Transcribed text
+        """
+        try:
+            with wave.open(audio_path, 'rb') as wf:
+                sample_rate = wf.getframerate()
+                channels = wf.getnchannels()
+                frame_size = wf.getsampwidth() * channels
+            
+            frames_per_chunk = STREAMING_CHUNK_SIZE // frame_size
+            
+            def chunks():
+                with wave.open(audio_path, 'rb') as wf:
+                    while True:
+                        chunk = wf.readframes(frames_per_chunk)
+                        if not chunk:
+                            break
+                        yield chunk
+            
+            return self._streaming_recognize(chunks(), sample_rate, channels, language_code)
+            
+        except Exception as e:
+            return f"Error during transcription: {str(e)}"
+        
+        finally:
+            # Clean up converted file if it was created
+            if audio_path.endswith('_converted.wav') and os.path.exists(audio_path):
+                os.remove(audio_path)
+    
+    def _streaming_recognize(self, chunks, sample_rate: int, channels: int, language_code: str) -> str:
+        """Run streaming recognition over an iterable of raw PCM chunks"""
+        # Stream raw PCM frames, so the sample rate has to be explicit
+        config = self._speech.RecognitionConfig(
+            self._get_config(language_code),
+            sample_rate_hertz=sample_rate,
+            audio_channel_count=channels
+        )
+        streaming_config = self._speech.StreamingRecognitionConfig(config=config)
+        
+        requests = (
+            self._speech.StreamingRecognizeRequest(audio_content=chunk)
+            for chunk in chunks
+        )
+        responses = self.client.streaming_recognize(streaming_config, requests)
+        
+        # Combine all final transcripts
+        transcription = " ".join(
+            result.alternatives[0].transcript
+            for response in responses
+            for result in response.results
+            if result.is_final and result.alternatives
+        )
+        
+        return transcription if transcription else "No speech detected in audio."
+    
+    def transcribe_pcm(self, pcm, rate: int, channels: int = 1, language_code: str = "auto"):
+        """
+        Transcribe raw 16-bit PCM audio held in memory
+        Skips writing and re-reading a WAV file for fresh recordings
+        
+        Args:
+            pcm: Bytes-like buffer of 16-bit little-endian samples
+            rate: Sample rate in Hz
+            channels: Number of interleaved channels
+            language_code: Language code (default: "auto" for automatic detection)
+            
+        Returns:
+            Transcribed text, or None if the audio is too long for streaming
+            recognition and must go through transcribe_audio() instead
+        """
+        pcm = memoryview(pcm).cast('B')
+        duration = len(pcm) / (rate * channels * 2)
+        if duration >= STREAMING_MAX_DURATION:
+            return None
+        
+        try:
+            # Short audio fits in a single synchronous request
+            if duration <= 55:
+                config = self._speech.RecognitionConfig(
+                    self._get_config(language_code),
+                    sample_rate_hertz=rate,
+                    audio_channel_count=channels
+                )
+                audio = self._speech.RecognitionAudio(content=bytes(pcm))
+                response = self.client.recognize(config=config, audio=audio)
+                transcription = " ".join(
+                    result.alternatives[0].transcript
+                    for result in response.results
+                )
+                return transcription if transcription else "No speech detected in audio."
+            
+            # Chunk sizes stay frame-aligned for any channel count
+            chunk_size = STREAMING_CHUNK_SIZE * channels
+            chunks = (
+                bytes(pcm[i:i + chunk_size])
+                for i in range(0, len(pcm), chunk_size)
+            )
+            return self._streaming_recognize(chunks, rate, channels, language_code)
+            
+        except Exception as e:
+            return f"Error during transcription: {str(e)}"
+    
     def _transcribe_long_audio(self, audio_path: str, language_code: str = "auto") -> str:
         """
         Transcribe long audio files using async recognition with GCS
@@ -202,25 +361,9 @@ class SpeechToTextService:
             gcs_uri, blob = self._upload_to_gcs(audio_path)
             
             # Configure recognition
-            audio = speech.RecognitionAudio(uri=gcs_uri)
+            audio = self._speech.RecognitionAudio(uri=gcs_uri)
             
-            if language_code == "auto":
-                config = speech.RecognitionConfig(
-                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                    language_code="en-US",
-                    alternative_language_codes=[
-                        "uk-UA", "ru-RU", "es-ES", "fr-FR", "de-DE",
-                        "it-IT", "pt-PT", "pl-PL", "ja-JP", "zh-CN",
-                        "ko-KR", "ar-SA", "hi-IN", "tr-TR"
-                    ],
-                    enable_automatic_punctuation=True,
-                )
-            else:
-                config = speech.RecognitionConfig(
-                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                    language_code=language_code,
-                    enable_automatic_punctuation=True,
-                )
+            config = self._get_config(language_code)
             
             # Start long-running recognition
             operation = self.client.long_running_recognize(config=config, audio=audio)
@@ -1,19 +1,87 @@
 """
 Gemini API integration for summarization via Vertex AI
 """
+import hashlib
 import os
-import vertexai
-from vertexai.generative_models import GenerativeModel
+import threading
+from collections import OrderedDict
+
+
+SUMMARY_PROMPT_PREFIX = """
+Please provide a concise, structured summary of the following audio transcription.
+Format the summary with:
+- Main Topic: [topic]
+- Key Points: [bullet points of main ideas]
+- Action Items: [any tasks or actions mentioned, if applicable]
+
+Keep it brief and well-organized.
+
+Transcription:
+"""
+
+TITLE_PROMPT_PREFIX = """
+Generate a very short title (maximum 5-6 words) for this audio note.
+Only return the title, nothing else.
+
+Transcription:
+"""
+
+# Number of summaries and titles remembered per service
+RESULT_CACHE_SIZE = 128
+
+# Longest transcription sent for summarization; longer text keeps its head and tail
+MAX_SUMMARY_CHARS = 24000
+
+# Only the start of the transcription is needed to generate a title
+MAX_TITLE_CHARS = 500
+
+# (project_id, credentials_path) that Vertex AI was last initialized with
+_vertex_initialized = None
 
 
 class SummarizerService:
     """Service for summarizing transcriptions using Gemini via Vertex AI"""
     
     def __init__(self, project_id: str, credentials_path: str):
-        # Initialize Vertex AI with service account credentials
-        os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
-        vertexai.init(project=project_id, location="us-central1")
+        # Imported lazily: the Vertex AI SDK is slow to import
+        import vertexai
+        from vertexai.generative_models import GenerativeModel, GenerationConfig
+        
+        # Initialize Vertex AI with service account credentials, once per process
+        # unless the project or credentials change
+        global _vertex_initialized
+        key = (project_id, credentials_path)
+        if _vertex_initialized != key:
+            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+            vertexai.init(project=project_id, location="us-central1")
+            _vertex_initialized = key
         self.model = GenerativeModel("gemini-2.5-flash")
+        self.generation_config = GenerationConfig(temperature=0.2)
+        
+        # LRU caches of model output keyed by transcription hash
+        self._summary_cache = OrderedDict()
+        self._title_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _cache_key(self, transcription: str) -> bytes:
+        """Hash a transcription into a compact cache key"""
+        return hashlib.blake2b(transcription.encode('utf-8'), digest_size=16).digest()
+    
+    def _cache_get(self, cache: OrderedDict, key: bytes):
+        """Look up a cached result and mark it as recently used"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, cache: OrderedDict, key: bytes, value: str) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
     
     def summarize(self, transcription: str) -> str:
         """
@@ -28,24 +96,28 @@ class SummarizerService:
         if not transcription or transcription.startswith("Error") or transcription == "No speech detected in audio.":
             return "No summary available."
         
-        prompt = f"""
-Please provide a concise, structured summary of the following audio transcription.
-Format the summary with:
-- Main Topic: [topic]
-- Key Points: [bullet points of main ideas]
-- Action Items: [any tasks or actions mentioned, if applicable]
-
-Keep it brief and well-organized.
-
-Transcription:
-{transcription}
-"""
+        key = self._cache_key(transcription)
+        cached = self._cache_get(self._summary_cache, key)
+        if cached is not None:
+            return cached
+        
+        # Cap the prompt size to bound model latency and quota on long audio
+        if len(transcription) > MAX_SUMMARY_CHARS:
+            half = MAX_SUMMARY_CHARS // 2
+            transcription = transcription[:half] + "\n[...]\n" + transcription[-half:]
+        
+        prompt = SUMMARY_PROMPT_PREFIX + transcription
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            response = self.model.generate_content(
+                prompt, generation_config=self.generation_config
+            )
+            summary = response.text
         except Exception as e:
             return f"Error generating summary: {str(e)}"
+        
+        self._cache_put(self._summary_cache, key, summary)
+        return summary
     
     def generate_title(self, transcription: str) -> str:
         """
@@ -60,17 +132,21 @@ Transcription:
         if not transcription or transcription.startswith("Error"):
             return "Untitled Note"
         
-        prompt = f"""
-Generate a very short title (maximum 5-6 words) for this audio note.
-Only return the title, nothing else.
-
-Transcription:
-{transcription[:500]}
-"""
+        key = self._cache_key(transcription)
+        cached = self._cache_get(self._title_cache, key)
+        if cached is not None:
+            return cached
+        
+        prompt = TITLE_PROMPT_PREFIX + transcription[:MAX_TITLE_CHARS]
         
         try:
-            response = self.model.generate_content(prompt)
+            response = self.model.generate_content(
+                prompt, generation_config=self.generation_config
+            )
             title = response.text.strip().replace('"', '').replace("'", "")
-            return title[:50] if len(title) > 50 else title
+            title = title[:50] if len(title) > 50 else title
         except Exception as e:
             return "Untitled Note"
+        
+        self._cache_put(self._title_cache, key, title)
+        return title
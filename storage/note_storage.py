@@ -3,79 +3,255 @@ Data storage and persistence for notes
 """
 import json
 import os
-from typing import List, Optional
+import threading
+from typing import List, Optional, Tuple
 from models.note import Note
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Rewrite the log on startup once this share of its records is stale
+COMPACT_THRESHOLD = 0.3
+
+# Evict the least recently used playback files once the cache exceeds this size
+PLAYBACK_CACHE_LIMIT = 500 * 1024 * 1024
+
+
+def _dumps(record: dict) -> bytes:
+    """Serialize a record to a single JSON line (without the newline)"""
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class NoteStorage:
     """Handles saving and loading notes"""
     
     def __init__(self, storage_dir: str = "notes_data"):
         self.storage_dir = storage_dir
-        self.notes_file = os.path.join(storage_dir, "notes.json")
+        self.notes_file = os.path.join(storage_dir, "notes.jsonl")
         self.audio_dir = os.path.join(storage_dir, "audio")
+        self.cache_dir = os.path.join(storage_dir, "cache")
+        
+        # Notes live in an append-only JSON Lines log: saves append the full
+        # note, deletes append a tombstone, and the index maps note ID to the
+        # latest live version
+        self._index = {}
+        self._record_count = 0
+        self._cache_stat = None
+        # Set when the log ends in a torn record without a trailing newline
+        self._needs_newline = False
+        # Notes hidden by forget_note() whose tombstone is not written yet
+        self._pending_deletes = set()
+        # Notes may be deleted from a worker thread while the UI reads them
+        self._lock = threading.RLock()
         
         # Create directories if they don't exist
         os.makedirs(self.storage_dir, exist_ok=True)
         os.makedirs(self.audio_dir, exist_ok=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Import notes saved by older versions as a single JSON array
+        legacy_file = os.path.join(storage_dir, "notes.json")
+        if not os.path.exists(self.notes_file) and os.path.exists(legacy_file):
+            self._migrate_legacy(legacy_file)
         
         # Initialize notes file if it doesn't exist
         if not os.path.exists(self.notes_file):
             self._save_notes([])
+        
+        self._load_notes()
+        
+        # Compact the log if too many records are overwritten or deleted
+        if self._record_count:
+            stale = self._record_count - len(self._index)
+            if stale / self._record_count > COMPACT_THRESHOLD:
+                self._save_notes(list(self._index.values()))
+        
+        # Trim the playback cache without delaying startup
+        threading.Thread(target=self._sweep_playback_cache, daemon=True).start()
+    
+    def _sweep_playback_cache(self) -> None:
+        """Evict the least recently used tenth of the playback cache when it is too big"""
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                # Leave conversions still being written alone
+                if name.endswith(".tmp.mp3"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_atime, path))
+                total_size += st.st_size
+        
+        if total_size <= PLAYBACK_CACHE_LIMIT:
+            return
+        
+        entries.sort()
+        for _, path in entries[:max(1, len(entries) // 10)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _migrate_legacy(self, legacy_file: str) -> None:
+        """Convert a legacy notes.json file into the JSONL log"""
+        try:
+            with open(legacy_file, 'rb') as f:
+                data = _loads(f.read())
+        except (json.JSONDecodeError, FileNotFoundError):
+            return
+        self._save_notes([Note.from_dict(note_dict) for note_dict in data])
+    
+    def _append(self, records: List[dict]) -> None:
+        """Append records to the log in a single write"""
+        data = b"".join(_dumps(record) + b"\n" for record in records)
+        # Terminate a torn last line first, or the new records would be
+        # glued onto it and lost on the next load
+        if self._needs_newline:
+            data = b"\n" + data
+        with open(self.notes_file, 'ab') as f:
+            f.write(data)
+        self._needs_newline = False
+        self._record_count += len(records)
+        self._cache_stat = self._stat_notes_file()
     
     def _save_notes(self, notes: List[Note]) -> None:
-        """Save notes to JSON file"""
-        with open(self.notes_file, 'w') as f:
-            json.dump([note.to_dict() for note in notes], f, indent=2)
+        """Rewrite the log with exactly the given notes"""
+        tmp_file = self.notes_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(b"".join(_dumps(note.to_dict()) + b"\n" for note in notes))
+        os.replace(tmp_file, self.notes_file)
+        
+        self._index = {note.id: note for note in notes}
+        self._needs_newline = False
+        self._record_count = len(notes)
+        self._cache_stat = self._stat_notes_file()
+    
+    def _stat_notes_file(self) -> Optional[tuple]:
+        """Get the (mtime, size) signature of the notes file"""
+        try:
+            st = os.stat(self.notes_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
     
     def _load_notes(self) -> List[Note]:
-        """Load notes from JSON file"""
+        """Replay the log into the in-memory index if the file has changed"""
+        stat = self._stat_notes_file()
+        if stat is not None and stat == self._cache_stat:
+            return list(self._index.values())
+        
+        index = {}
+        count = 0
+        needs_newline = False
         try:
-            with open(self.notes_file, 'r') as f:
-                data = json.load(f)
-                return [Note.from_dict(note_dict) for note_dict in data]
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            with open(self.notes_file, 'rb') as f:
+                for line in f:
+                    needs_newline = not line.endswith(b"\n")
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # Skip a partially written record (JSONDecodeError, or
+                        # UnicodeDecodeError when cut mid-character)
+                        continue
+                    count += 1
+                    if record.get('_deleted'):
+                        index.pop(record['id'], None)
+                    else:
+                        index[record['id']] = Note.from_dict(record)
+        except FileNotFoundError:
+            pass
+        
+        for note_id in self._pending_deletes:
+            index.pop(note_id, None)
+        
+        self._index = index
+        self._needs_newline = needs_newline
+        self._record_count = count
+        self._cache_stat = stat
+        return list(index.values())
     
     def get_all_notes(self) -> List[Note]:
         """Get all notes"""
-        return self._load_notes()
+        with self._lock:
+            return self._load_notes()
+    
+    def get_notes_list_view(self) -> Tuple[List[str], List[str], List[str]]:
+        """Get the notes list columns as parallel lists (ids, titles, created_ats), sliced from the loaded notes"""
+        with self._lock:
+            notes = self._load_notes()
+        return (
+            [note.id for note in notes],
+            [note.title for note in notes],
+            [note.created_at for note in notes],
+        )
     
     def get_note_by_id(self, note_id: str) -> Optional[Note]:
         """Get a specific note by ID"""
-        notes = self._load_notes()
-        for note in notes:
-            if note.id == note_id:
-                return note
-        return None
+        with self._lock:
+            self._load_notes()
+            return self._index.get(note_id)
     
     def save_note(self, note: Note) -> None:
         """Save or update a note"""
-        notes = self._load_notes()
-        
-        # Update existing note or add new one
-        found = False
-        for i, existing_note in enumerate(notes):
-            if existing_note.id == note.id:
-                notes[i] = note
-                found = True
-                break
-        
-        if not found:
-            notes.append(note)
+        with self._lock:
+            self._load_notes()
+            self._append([note.to_dict()])
+            self._index[note.id] = note
+    
+    def save_notes_batch(self, notes: List[Note]) -> None:
+        """Save or update many notes at once (e.g. for bulk imports)"""
+        if not notes:
+            return
         
-        self._save_notes(notes)
+        with self._lock:
+            self._load_notes()
+            self._append([note.to_dict() for note in notes])
+            for note in notes:
+                self._index[note.id] = note
     
     def delete_note(self, note_id: str) -> bool:
         """Delete a note by ID"""
-        notes = self._load_notes()
-        initial_length = len(notes)
-        notes = [note for note in notes if note.id != note_id]
-        
-        if len(notes) < initial_length:
-            self._save_notes(notes)
+        with self._lock:
+            self._load_notes()
+            if note_id in self._pending_deletes:
+                self._pending_deletes.discard(note_id)
+            elif note_id in self._index:
+                del self._index[note_id]
+            else:
+                return False
+            
+            self._append([{"id": note_id, "_deleted": True}])
+            return True
+    
+    def forget_note(self, note_id: str) -> bool:
+        """Hide a note from reads at once; delete_note() must follow to persist it"""
+        with self._lock:
+            self._load_notes()
+            if note_id not in self._index:
+                return False
+            
+            del self._index[note_id]
+            self._pending_deletes.add(note_id)
             return True
-        return False
     
     def get_audio_path(self, filename: str) -> str:
         """Get full path for an audio file"""
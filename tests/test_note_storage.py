@@ -0,0 +1,75 @@
+"""
+Tests for the append-only notes log
+"""
+import shutil
+import tempfile
+import unittest
+
+from models.note import Note
+from storage.note_storage import NoteStorage
+
+
+def make_note(note_id: str) -> Note:
+    return Note(
+        id=note_id,
+        title=f"Note {note_id}",
+        audio_path=f"{note_id}.wav",
+        transcription="",
+        summary="",
+        created_at="2024-01-01 00:00:00",
+        duration=0.0
+    )
+
+
+class TornLogTest(unittest.TestCase):
+    """A crash mid-append must not swallow the next saved note"""
+
+    def setUp(self):
+        self.storage_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.storage_dir)
+
+    def test_save_after_torn_line_survives_reload(self):
+        storage = NoteStorage(self.storage_dir)
+        storage.save_notes_batch([make_note(str(i)) for i in range(10)])
+
+        # Simulate a crash partway through writing a record
+        with open(storage.notes_file, 'ab') as f:
+            f.write(b'{"id": "5", "tit')
+
+        storage = NoteStorage(self.storage_dir)
+        storage.save_note(make_note("42"))
+
+        reloaded = NoteStorage(self.storage_dir)
+        self.assertIsNotNone(reloaded.get_note_by_id("42"))
+        self.assertEqual(len(reloaded.get_all_notes()), 11)
+
+
+class ForgetNoteTest(unittest.TestCase):
+    """A forgotten note stays hidden until its deletion is written"""
+
+    def setUp(self):
+        self.storage_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.storage_dir)
+
+    def test_forgotten_note_not_reloaded_before_delete(self):
+        storage = NoteStorage(self.storage_dir)
+        storage.save_notes_batch([make_note(str(i)) for i in range(3)])
+
+        self.assertTrue(storage.forget_note("1"))
+
+        # Force a replay of the log, which still holds the note
+        storage._cache_stat = None
+        self.assertIsNone(storage.get_note_by_id("1"))
+
+        self.assertTrue(storage.delete_note("1"))
+        reloaded = NoteStorage(self.storage_dir)
+        self.assertIsNone(reloaded.get_note_by_id("1"))
+        self.assertEqual(len(reloaded.get_all_notes()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
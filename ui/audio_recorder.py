@@ -2,16 +2,296 @@
 Audio recording dialog
 """
 import os
+import shutil
+import tempfile
 import wave
 import pyaudio
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QLabel, QFileDialog, QMessageBox, QLineEdit
+    QLabel, QFileDialog, QMessageBox, QLineEdit, QCheckBox
 )
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QTimer, Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from datetime import datetime
 
 
+# Longest recording held in the pre-allocated buffer; longer takes spill
+# into a list of blocks
+MAX_RECORDING_SECONDS = 600
+
+# Sample rate for recordings, in Hz
+RECORDING_RATE = 16000
+
+# Bytes per sample for recordings; fixed because the stream format is paInt16
+SAMPLE_WIDTH = 2
+
+# Lower bound for PyAudio frames_per_buffer
+MIN_FRAMES_PER_BUFFER = 2048
+
+# File buffer used when writing recordings to disk
+WAV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Gain applied to recordings when "Boost volume" is checked
+BOOST_GAIN = 2.0
+
+
+# Record button states are selected through its dynamic "state" property,
+# so one stylesheet covers idle, recording and done
+DIALOG_STYLE = """
+    QDialog {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 #667eea,
+            stop:1 #764ba2
+        );
+    }
+"""
+
+TITLE_STYLE = """
+    font-size: 24px;
+    font-weight: bold;
+    color: white;
+    background: transparent;
+"""
+
+NAME_LABEL_STYLE = """
+    color: white;
+    font-size: 14px;
+    background: transparent;
+"""
+
+NAME_INPUT_STYLE = """
+    QLineEdit {
+        background: rgba(255, 255, 255, 0.9);
+        border: none;
+        border-radius: 10px;
+        padding: 12px;
+        font-size: 14px;
+        color: #333;
+    }
+    QLineEdit:focus {
+        background: white;
+    }
+"""
+
+BOOST_CHECKBOX_STYLE = """
+    QCheckBox {
+        color: white;
+        font-size: 14px;
+        background: transparent;
+    }
+"""
+
+RECORD_BTN_STYLE = """
+    QPushButton {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f093fb,
+            stop:1 #f5576c
+        );
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f5576c,
+            stop:1 #f093fb
+        );
+    }
+    QPushButton[state="recording"],
+    QPushButton[state="recording"]:hover {
+        background: #ff4444;
+    }
+    QPushButton[state="done"],
+    QPushButton[state="done"]:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #11998e,
+            stop:1 #38ef7d
+        );
+    }
+"""
+
+SEPARATOR_STYLE = """
+    color: rgba(255, 255, 255, 0.7);
+    font-size: 14px;
+    margin: 10px;
+    background: transparent;
+"""
+
+UPLOAD_BTN_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.2);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.3);
+    }
+"""
+
+CANCEL_BTN_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.15);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 12px 24px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.25);
+    }
+"""
+
+OK_BTN_STYLE = """
+    QPushButton {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4facfe,
+            stop:1 #00f2fe
+        );
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #00f2fe,
+            stop:1 #4facfe
+        );
+    }
+    QPushButton:disabled {
+        background: rgba(255, 255, 255, 0.1);
+        color: rgba(255, 255, 255, 0.4);
+    }
+"""
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy a file, avoiding a full byte copy when the filesystem allows it"""
+    # A hard link shares the data; the copy is only ever read afterwards
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    _copy_data(src, dst)
+
+
+def _copy_data(src: str, dst: str) -> None:
+    """Copy a file's bytes, letting the kernel do it where possible"""
+    # Kernel-side copy (reflink on btrfs/xfs), Linux only
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    
+    shutil.copy2(src, dst)
+
+
+def _apply_gain(buf, mult: float) -> bytes:
+    """Scale 16-bit PCM samples by mult, hard-clipping to the int16 range"""
+    # Imported lazily: only needed when the volume boost is used
+    import numpy as np
+    samples = np.frombuffer(buf, dtype=np.int16).astype(np.int32)
+    return np.clip(samples * mult, -32768, 32767).astype(np.int16).tobytes()
+
+
+def _is_volatile(path: str) -> bool:
+    """Check whether a file lives somewhere that may be cleaned up (temp dir)"""
+    temp_dir = os.path.realpath(tempfile.gettempdir())
+    try:
+        return os.path.commonpath([os.path.realpath(path), temp_dir]) == temp_dir
+    except ValueError:
+        # Different drives on Windows
+        return False
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Reference a stable file in place, copying only volatile ones"""
+    if not _is_volatile(src):
+        # A hard link survives the original being moved or deleted
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+        
+        # Across filesystems, point at the original (deleting the note
+        # only removes the link); may need privileges on Windows
+        try:
+            os.symlink(os.path.abspath(src), dst)
+            return
+        except OSError:
+            pass
+        
+        # The hard link was already tried above
+        _copy_data(src, dst)
+        return
+    
+    _fast_copy(src, dst)
+
+
+class WavWriteSignals(QObject):
+    """Signals for WavWriteRunnable"""
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+
+class WavWriteRunnable(QRunnable):
+    """Writes recorded PCM data to a WAV file on a thread pool worker"""
+    
+    def __init__(self, path, blocks, channels, sample_width, rate):
+        super().__init__()
+        self.path = path
+        self.blocks = blocks
+        self.channels = channels
+        self.sample_width = sample_width
+        self.rate = rate
+        self.signals = WavWriteSignals()
+    
+    def run(self):
+        """Write the WAV file"""
+        try:
+            # Write through a large buffer; declaring the frame count up front
+            # lets the header be written once instead of patched on close
+            data_len = sum(len(block) for block in self.blocks)
+            with open(self.path, 'wb', buffering=WAV_WRITE_BUFFER_SIZE) as raw:
+                with wave.open(raw, 'wb') as wf:
+                    wf.setnchannels(self.channels)
+                    wf.setsampwidth(self.sample_width)
+                    wf.setframerate(self.rate)
+                    wf.setnframes(data_len // (self.sample_width * self.channels))
+                    for block in self.blocks:
+                        wf.writeframes(block)
+            self.signals.finished.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
 class AudioRecorderDialog(QDialog):
     """Dialog for recording or uploading audio"""
     
@@ -20,9 +300,13 @@ class AudioRecorderDialog(QDialog):
         self.storage_dir = storage_dir
         self.audio_path = None
         self.is_recording = False
-        self.frames = []
+        self._buf = bytearray()
+        self._buf_pos = [0]
+        self._overflow = []
+        self._pcm = None
         self.audio = None
         self.stream = None
+        self._wav_writer = None
         self.recording_time = 0
         
         self.setup_ui()
@@ -35,15 +319,7 @@ class AudioRecorderDialog(QDialog):
         self.resize(500, 400)
         
         # Gradient background
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #667eea,
-                    stop:1 #764ba2
-                );
-            }
-        """)
+        self.setStyleSheet(DIALOG_STYLE)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(30, 30, 30, 30)
@@ -51,98 +327,43 @@ class AudioRecorderDialog(QDialog):
         
         # Title
         title = QLabel("Add Audio Note")
-        title.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: white;
-            background: transparent;
-        """)
+        title.setStyleSheet(TITLE_STYLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Note name input
         name_label = QLabel("Note Name (optional):")
-        name_label.setStyleSheet("""
-            color: white;
-            font-size: 14px;
-            background: transparent;
-        """)
+        name_label.setStyleSheet(NAME_LABEL_STYLE)
         layout.addWidget(name_label)
         
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter a name for your note...")
-        self.name_input.setStyleSheet("""
-            QLineEdit {
-                background: rgba(255, 255, 255, 0.9);
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                font-size: 14px;
-                color: #333;
-            }
-            QLineEdit:focus {
-                background: white;
-            }
-        """)
+        self.name_input.setStyleSheet(NAME_INPUT_STYLE)
         layout.addWidget(self.name_input)
         
+        # Volume boost for quiet recordings
+        self.boost_checkbox = QCheckBox("Boost volume")
+        self.boost_checkbox.setStyleSheet(BOOST_CHECKBOX_STYLE)
+        layout.addWidget(self.boost_checkbox)
+        
         layout.addSpacing(10)
         
         # Record button
         self.record_btn = QPushButton("🎤 Start Recording")
         self.record_btn.clicked.connect(self.toggle_recording)
-        self.record_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #f093fb,
-                    stop:1 #f5576c
-                );
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #f5576c,
-                    stop:1 #f093fb
-                );
-            }
-        """)
+        self.record_btn.setStyleSheet(RECORD_BTN_STYLE)
         layout.addWidget(self.record_btn)
         
         # Or separator
         separator = QLabel("— OR —")
         separator.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        separator.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 14px;
-            margin: 10px;
-            background: transparent;
-        """)
+        separator.setStyleSheet(SEPARATOR_STYLE)
         layout.addWidget(separator)
         
         # Upload button
         upload_btn = QPushButton("📁 Upload Audio File")
         upload_btn.clicked.connect(self.upload_audio)
-        upload_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.2);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.3);
-            }
-        """)
+        upload_btn.setStyleSheet(UPLOAD_BTN_STYLE)
         layout.addWidget(upload_btn)
         
         layout.addStretch()
@@ -152,50 +373,13 @@ class AudioRecorderDialog(QDialog):
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.15);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 24px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.25);
-            }
-        """)
+        cancel_btn.setStyleSheet(CANCEL_BTN_STYLE)
         button_layout.addWidget(cancel_btn)
         
         self.ok_btn = QPushButton("Create Note")
         self.ok_btn.clicked.connect(self.accept)
         self.ok_btn.setEnabled(False)
-        self.ok_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4facfe,
-                    stop:1 #00f2fe
-                );
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #00f2fe,
-                    stop:1 #4facfe
-                );
-            }
-            QPushButton:disabled {
-                background: rgba(255, 255, 255, 0.1);
-                color: rgba(255, 255, 255, 0.4);
-            }
-        """)
+        self.ok_btn.setStyleSheet(OK_BTN_STYLE)
         button_layout.addWidget(self.ok_btn)
         
         layout.addLayout(button_layout)
@@ -207,12 +391,20 @@ class AudioRecorderDialog(QDialog):
         self.timer.timeout.connect(self.update_recording_time)
     
     def setup_audio(self):
-        """Setup PyAudio for recording"""
-        self.audio = pyaudio.PyAudio()
-        self.chunk = 1024
+        """Setup recording parameters (PyAudio itself is created on first recording)"""
         self.format = pyaudio.paInt16
         self.channels = 1
-        self.rate = 16000
+        # 16 kHz mono 16-bit is what speech recognition expects; don't raise it
+        self.rate = RECORDING_RATE
+        # ~128 ms per callback keeps the callback rate low without audible lag
+        self.chunk = max(MIN_FRAMES_PER_BUFFER, self.rate // 10)
+        self._max_bytes = self.rate * SAMPLE_WIDTH * self.channels * MAX_RECORDING_SECONDS
+    
+    def _set_record_state(self, state: str):
+        """Restyle the record button via its "state" property"""
+        self.record_btn.setProperty("state", state)
+        self.record_btn.style().unpolish(self.record_btn)
+        self.record_btn.style().polish(self.record_btn)
     
     def toggle_recording(self):
         """Start or stop recording"""
@@ -224,9 +416,17 @@ class AudioRecorderDialog(QDialog):
     def start_recording(self):
         """Start recording audio"""
         try:
-            self.frames = []
+            self._buf = bytearray(self._max_bytes)
+            self._buf_pos = [0]
+            self._overflow = []
+            # Everything the callback touches, bound once per recording
+            self._cb_state = (memoryview(self._buf), self._buf_pos, self._overflow)
             self.recording_time = 0
             
+            # Created lazily: PyAudio probes every audio device on startup
+            if self.audio is None:
+                self.audio = pyaudio.PyAudio()
+            
             self.stream = self.audio.open(
                 format=self.format,
                 channels=self.channels,
@@ -239,17 +439,7 @@ class AudioRecorderDialog(QDialog):
             self.stream.start_stream()
             self.is_recording = True
             self.record_btn.setText("⏹ Stop Recording")
-            self.record_btn.setStyleSheet("""
-                QPushButton {
-                    background: #ff4444;
-                    color: white;
-                    border: none;
-                    border-radius: 12px;
-                    padding: 15px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-            """)
+            self._set_record_state("recording")
             self.timer.start(1000)  # Update every second
             
         except Exception as e:
@@ -263,22 +453,8 @@ class AudioRecorderDialog(QDialog):
         
         self.is_recording = False
         self.timer.stop()
-        self.record_btn.setText("✅ Recording Saved")
-        self.record_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #11998e,
-                    stop:1 #38ef7d
-                );
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.record_btn.setText("💾 Saving Recording...")
+        self._set_record_state("done")
         self.record_btn.setEnabled(False)
         
         # Save recording
@@ -286,19 +462,47 @@ class AudioRecorderDialog(QDialog):
         filename = f"recording_{timestamp}.wav"
         self.audio_path = os.path.join(self.storage_dir, filename)
         
-        # Write WAV file
-        with wave.open(self.audio_path, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.audio.get_sample_size(self.format))
-            wf.setframerate(self.rate)
-            wf.writeframes(b''.join(self.frames))
-        
+        # Write WAV file on a worker thread so the dialog stays responsive
+        blocks = [memoryview(self._buf)[:self._buf_pos[0]]] + self._overflow
+        if self.boost_checkbox.isChecked():
+            blocks = [_apply_gain(b"".join(blocks), BOOST_GAIN)]
+        # Keep the PCM for transcription so it need not be read back from disk
+        self._pcm = blocks[0] if len(blocks) == 1 else b"".join(blocks)
+        self._wav_writer = WavWriteRunnable(
+            self.audio_path,
+            blocks,
+            self.channels,
+            SAMPLE_WIDTH,
+            self.rate
+        )
+        self._wav_writer.signals.finished.connect(self.on_recording_saved)
+        self._wav_writer.signals.error.connect(self.on_recording_save_error)
+        QThreadPool.globalInstance().start(self._wav_writer)
+    
+    def on_recording_saved(self):
+        """Handle the recording being written to disk"""
+        self.record_btn.setText("✅ Recording Saved")
         self.ok_btn.setEnabled(True)
     
+    def on_recording_save_error(self, error):
+        """Handle a failure writing the recording"""
+        self.audio_path = None
+        self._pcm = None
+        self.record_btn.setText("❌ Recording Not Saved")
+        QMessageBox.critical(self, "Error", f"Failed to save recording: {error}")
+    
     def audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback for audio stream"""
-        self.frames.append(in_data)
-        return (in_data, pyaudio.paContinue)
+        """Callback for audio stream (runs on the PortAudio thread)"""
+        mv, pos, overflow = self._cb_state
+        start = pos[0]
+        end = start + len(in_data)
+        if overflow or end > len(mv):
+            overflow.append(in_data)
+        else:
+            mv[start:end] = in_data
+            pos[0] = end
+        # Input-only stream, so there is no output buffer to hand back
+        return (None, pyaudio.paContinue)
     
     def update_recording_time(self):
         """Update recording time display"""
@@ -317,33 +521,19 @@ class AudioRecorderDialog(QDialog):
         )
         
         if file_path:
-            # Copy file to storage directory
+            # Add file to storage directory
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             file_ext = os.path.splitext(file_path)[1]
             filename = f"upload_{timestamp}{file_ext}"
             self.audio_path = os.path.join(self.storage_dir, filename)
+            self._pcm = None
             
-            # Copy file
-            import shutil
-            shutil.copy2(file_path, self.audio_path)
+            # Reference the file in place where possible, copy otherwise
+            _link_or_copy(file_path, self.audio_path)
             
             # Show success
             self.record_btn.setText(f"✅ File Uploaded")
-            self.record_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #11998e,
-                        stop:1 #38ef7d
-                    );
-                    color: white;
-                    border: none;
-                    border-radius: 12px;
-                    padding: 15px;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-            """)
+            self._set_record_state("done")
             self.record_btn.setEnabled(False)
             self.ok_btn.setEnabled(True)
     
@@ -351,6 +541,10 @@ class AudioRecorderDialog(QDialog):
         """Get the path to the recorded/uploaded audio"""
         return self.audio_path
     
+    def get_pcm_buffer(self):
+        """Get the raw PCM of the recording, or None for uploaded files"""
+        return self._pcm
+    
     def get_note_name(self) -> str:
         """Get the custom note name if provided"""
         return self.name_input.text().strip() if hasattr(self, 'name_input') else ""
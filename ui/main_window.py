@@ -2,12 +2,13 @@
 Main application window
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QListWidget, QListWidgetItem, QLabel,
-    QMessageBox, QProgressDialog, QComboBox, QFrame
+    QMessageBox, QComboBox, QFrame, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
 from datetime import datetime
 from models.note import Note
@@ -15,45 +16,70 @@ from storage.note_storage import NoteStorage
 from services.speech_to_text import SpeechToTextService
 from services.summarizer import SummarizerService
 from services.audio_player import AudioPlayer
-from ui.audio_recorder import AudioRecorderDialog
+from ui.audio_recorder import AudioRecorderDialog, RECORDING_RATE
 from ui.note_detail import NoteDetailView
 import uuid
 
 
-class ProcessAudioThread(QThread):
-    """Thread for processing audio (transcription and summarization)"""
+class AudioProcessSignals(QObject):
+    """Signals for AudioProcessRunnable"""
     finished = pyqtSignal(str, str, str, float)  # transcription, summary, title, duration
     error = pyqtSignal(str)
+
+
+class AudioProcessRunnable(QRunnable):
+    """Thread pool job for processing audio (transcription and summarization)"""
     
-    def __init__(self, audio_path, stt_service, summarizer_service, audio_player, custom_name=""):
+    def __init__(self, audio_path, stt_service, summarizer_service, audio_player, custom_name="",
+                 pcm_buffer=None):
         super().__init__()
         self.audio_path = audio_path
+        self.pcm_buffer = pcm_buffer
         self.stt_service = stt_service
         self.summarizer_service = summarizer_service
         self.audio_player = audio_player
         self.custom_name = custom_name
+        self.signals = AudioProcessSignals()
+        self._cancelled = False
+    
+    def cancel(self):
+        """Skip the remaining steps and results (the current API call still completes)"""
+        self._cancelled = True
     
     def run(self):
         """Process the audio file"""
         try:
-            # Get duration
-            duration = self.audio_player.get_duration(self.audio_path)
-            
-            # Transcribe
-            transcription = self.stt_service.transcribe_audio(self.audio_path)
-            
-            # Summarize
-            summary = self.summarizer_service.summarize(transcription)
-            
-            # Generate title (use custom name if provided)
-            if self.custom_name:
-                title = self.custom_name
-            else:
-                title = self.summarizer_service.generate_title(transcription)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # Probe duration while the transcription runs
+                duration_future = executor.submit(self.audio_player.get_duration, self.audio_path)
+                
+                # Transcribe, straight from memory for fresh recordings
+                transcription = None
+                if self.pcm_buffer is not None:
+                    transcription = self.stt_service.transcribe_pcm(
+                        self.pcm_buffer, RECORDING_RATE, 1
+                    )
+                if transcription is None:
+                    transcription = self.stt_service.transcribe_audio(self.audio_path)
+                
+                if self._cancelled:
+                    return
+                
+                # Summarize and generate title concurrently (use custom name if provided)
+                summary_future = executor.submit(self.summarizer_service.summarize, transcription)
+                title_future = None
+                if not self.custom_name:
+                    title_future = executor.submit(self.summarizer_service.generate_title, transcription)
+                
+                duration = duration_future.result()
+                summary = summary_future.result()
+                title = self.custom_name or title_future.result()
             
-            self.finished.emit(transcription, summary, title, duration)
+            if not self._cancelled:
+                self.signals.finished.emit(transcription, summary, title, duration)
         except Exception as e:
-            self.error.emit(str(e))
+            if not self._cancelled:
+                self.signals.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -64,7 +90,11 @@ class MainWindow(QMainWindow):
         self.stt_service = stt_service
         self.summarizer_service = summarizer_service
         self.storage = NoteStorage()
-        self.audio_player = AudioPlayer()
+        self.audio_player = AudioPlayer(self.storage.cache_dir)
+        self._date_cache = {}
+        self._busy_overlay = None
+        self._process_job = None
+        self._pending_audio = []
         
         self.setup_ui()
         self.load_notes()
@@ -74,12 +104,15 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Audio Notes")
         self.resize(900, 700)
         
-        # Central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        # Pages for the notes list and the note detail view
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+        
+        # Notes list page
+        self.list_page = QWidget()
         
         # Modern gradient background
-        central_widget.setStyleSheet("""
+        self.list_page.setStyleSheet("""
             QWidget {
                 background: qlineargradient(
                     x1:0, y1:0, x2:1, y2:1,
@@ -187,7 +220,10 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(sort_layout)
         
-        # Notes list with modern styling
+        # Notes list with modern styling; rows are cached by note ID
+        self._items = {}
+        self._item_font = QFont()
+        self._item_font.setPointSize(13)
         self.notes_list = QListWidget()
         self.notes_list.itemClicked.connect(self.open_note)
         self.notes_list.setStyleSheet("""
@@ -228,51 +264,75 @@ class MainWindow(QMainWindow):
         """)
         layout.addWidget(self.empty_label)
         
-        central_widget.setLayout(layout)
+        self.list_page.setLayout(layout)
+        self.stack.addWidget(self.list_page)
         
-        # Note detail view (hidden initially)
+        # Note detail view
         self.detail_view = NoteDetailView(self)
-        self.detail_view.hide()
+        self.detail_view.back_btn.clicked.connect(self.show_notes_list)
+        self.detail_view.noteDeleted.connect(self.on_note_deleted)
+        self.stack.addWidget(self.detail_view)
     
     def load_notes(self):
         """Load all notes from storage with sorting"""
-        self.notes_list.clear()
-        notes = self.storage.get_all_notes()
+        ids, titles, created_ats = self.storage.get_notes_list_view()
         
-        if not notes:
+        # Drop rows for notes that no longer exist
+        note_ids = set(ids)
+        for note_id in [i for i in self._items if i not in note_ids]:
+            item = self._items.pop(note_id)
+            self.notes_list.takeItem(self.notes_list.row(item))
+        
+        if not ids:
             self.notes_list.hide()
             self.empty_label.show()
         else:
-            # Sort notes
+            # Sort row indices rather than notes
+            order = range(len(ids))
             sort_option = self.sort_combo.currentIndex() if hasattr(self, 'sort_combo') else 0
             if sort_option == 0:  # Newest First
-                notes.sort(key=lambda n: n.created_at, reverse=True)
+                order = sorted(order, key=created_ats.__getitem__, reverse=True)
             elif sort_option == 1:  # Oldest First
-                notes.sort(key=lambda n: n.created_at)
-            elif sort_option == 2:  # Title A-Z
-                notes.sort(key=lambda n: n.title.lower())
-            elif sort_option == 3:  # Title Z-A
-                notes.sort(key=lambda n: n.title.lower(), reverse=True)
+                order = sorted(order, key=created_ats.__getitem__)
+            elif sort_option in (2, 3):  # Title A-Z / Z-A
+                lowered = [title.lower() for title in titles]
+                order = sorted(order, key=lowered.__getitem__, reverse=sort_option == 3)
             
             self.notes_list.show()
             self.empty_label.hide()
             
-            for note in notes:
-                # Format date
-                try:
-                    from datetime import datetime
-                    dt = datetime.strptime(note.created_at, "%Y-%m-%d %H:%M:%S")
-                    date_str = dt.strftime("%b %d, %Y")
-                except:
-                    date_str = note.created_at
+            # Reuse existing rows; only create, update or move what changed
+            for row, i in enumerate(order):
+                note_id = ids[i]
+                created_at = created_ats[i]
+                
+                # Format date (strptime is slow, so results are cached)
+                date_str = self._date_cache.get(created_at)
+                if date_str is None:
+                    try:
+                        dt = datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S")
+                        date_str = dt.strftime("%b %d, %Y")
+                    except:
+                        date_str = created_at
+                    self._date_cache[created_at] = date_str
+                
+                item_text = f"🎵  {titles[i]}\n     📅 {date_str}"
+                item = self._items.get(note_id)
+                if item is None:
+                    item = QListWidgetItem(item_text)
+                    item.setData(Qt.ItemDataRole.UserRole, note_id)
+                    item.setFont(self._item_font)
+                    self._items[note_id] = item
+                    self.notes_list.insertItem(row, item)
+                    continue
                 
-                item_text = f"🎵  {note.title}\n     📅 {date_str}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, note.id)
-                font = QFont()
-                font.setPointSize(13)
-                item.setFont(font)
-                self.notes_list.addItem(item)
+                if item.text() != item_text:
+                    item.setText(item_text)
+                
+                current_row = self.notes_list.row(item)
+                if current_row != row:
+                    self.notes_list.takeItem(current_row)
+                    self.notes_list.insertItem(row, item)
     
     def add_note(self):
         """Open dialog to add a new note"""
@@ -282,35 +342,104 @@ class MainWindow(QMainWindow):
             audio_path = dialog.get_audio_path()
             custom_name = dialog.get_note_name()
             if audio_path:
-                self.process_audio(audio_path, custom_name)
+                self.process_audio(audio_path, custom_name, dialog.get_pcm_buffer())
+    
+    def show_busy(self, text: str):
+        """Show the busy overlay on top of the window"""
+        # Built once on first use, then only shown and hidden
+        if self._busy_overlay is None:
+            self._busy_overlay = QLabel(self)
+            self._busy_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._busy_overlay.setStyleSheet("""
+                background: rgba(0, 0, 0, 0.45);
+                color: white;
+                font-size: 20px;
+                font-weight: bold;
+            """)
+        
+        # The overlay only stops the mouse; disabling the pages also keeps
+        # keyboard focus and shortcuts away from the widgets under it
+        self.stack.setEnabled(False)
+        
+        self._busy_overlay.setText(text)
+        self._busy_overlay.setGeometry(self.rect())
+        self._busy_overlay.raise_()
+        self._busy_overlay.show()
+    
+    def hide_busy(self):
+        """Hide the busy overlay"""
+        self.stack.setEnabled(True)
+        if self._busy_overlay is not None:
+            self._busy_overlay.hide()
     
-    def process_audio(self, audio_path: str, custom_name: str = ""):
+    def resizeEvent(self, event):
+        """Keep the busy overlay covering the window"""
+        super().resizeEvent(event)
+        if self._busy_overlay is not None:
+            self._busy_overlay.setGeometry(self.rect())
+    
+    def process_audio(self, audio_path: str, custom_name: str = "", pcm_buffer=None):
         """Process audio file (transcription and summarization)"""
-        # Show progress dialog
-        progress = QProgressDialog("Processing audio...", None, 0, 0, self)
-        progress.setWindowTitle("Please Wait")
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.show()
-        
-        # Create and start processing thread
-        self.process_thread = ProcessAudioThread(
+        # One job runs at a time; later audio waits its turn rather than
+        # replacing the running job and losing its note
+        if self._process_job is not None:
+            self._pending_audio.append((audio_path, custom_name, pcm_buffer))
+            return
+        
+        # Cover the window while processing
+        self.show_busy("⏳ Processing audio...")
+        
+        # Run processing on a shared thread pool worker
+        job = AudioProcessRunnable(
             audio_path,
             self.stt_service,
             self.summarizer_service,
             self.audio_player,
-            custom_name
+            custom_name,
+            pcm_buffer
         )
-        self.process_thread.finished.connect(
-            lambda t, s, title, d: self.on_processing_finished(audio_path, t, s, title, d, progress)
+        job.signals.finished.connect(
+            lambda t, s, title, d: self.on_processing_finished(job, audio_path, t, s, title, d)
         )
-        self.process_thread.error.connect(
-            lambda e: self.on_processing_error(e, progress)
-        )
-        self.process_thread.start()
+        job.signals.error.connect(lambda error: self.on_processing_error(job, error))
+        self._process_job = job
+        QThreadPool.globalInstance().start(job)
+    
+    def _finish_job(self, job) -> bool:
+        """Stop tracking a finished job; returns False if it was cancelled"""
+        if job is not self._process_job:
+            return False
+        self._process_job = None
+        
+        if self._pending_audio:
+            self.process_audio(*self._pending_audio.pop(0))
+        else:
+            self.hide_busy()
+        return True
+    
+    def cancel_processing(self):
+        """Cancel the processing job and any queued audio; the audio stays on disk"""
+        self._pending_audio.clear()
+        job = self._process_job
+        if job is None:
+            return
+        self._process_job = None
+        
+        # A queued job never starts; a running one skips its remaining steps,
+        # but the pool still waits for the API call in progress
+        if not QThreadPool.globalInstance().tryTake(job):
+            job.cancel()
+        self.hide_busy()
+    
+    def closeEvent(self, event):
+        """Cancel outstanding processing when the window closes"""
+        self.cancel_processing()
+        super().closeEvent(event)
     
-    def on_processing_finished(self, audio_path, transcription, summary, title, duration, progress):
+    def on_processing_finished(self, job, audio_path, transcription, summary, title, duration):
         """Handle successful processing"""
-        progress.close()
+        if not self._finish_job(job):
+            return
         
         # Create new note
         note = Note(
@@ -331,9 +460,10 @@ class MainWindow(QMainWindow):
         
         QMessageBox.information(self, "Success", "Note created successfully!")
     
-    def on_processing_error(self, error, progress):
+    def on_processing_error(self, job, error):
         """Handle processing error"""
-        progress.close()
+        if not self._finish_job(job):
+            return
         QMessageBox.critical(self, "Error", f"Failed to process audio: {error}")
     
     def open_note(self, item):
@@ -342,25 +472,22 @@ class MainWindow(QMainWindow):
         note = self.storage.get_note_by_id(note_id)
         
         if note:
-            # Hide main window content and show detail view
-            self.centralWidget().hide()
             self.detail_view.load_note(note)
-            self.detail_view.setParent(None)
-            self.setCentralWidget(self.detail_view)
-            self.detail_view.show()
-            
-            # Connect back button
-            def go_back():
-                self.detail_view.hide()
-                central_widget = QWidget()
-                self.setCentralWidget(central_widget)
-                self.setup_ui()
-                self.load_notes()
-            
-            # Disconnect any existing connections
-            try:
-                self.detail_view.findChild(QPushButton).clicked.disconnect()
-            except:
-                pass
-            
-            self.detail_view.findChild(QPushButton).clicked.connect(go_back)
+            self.stack.setCurrentWidget(self.detail_view)
+    
+    def show_notes_list(self):
+        """Switch back from the detail view to the notes list"""
+        self.stack.setCurrentWidget(self.list_page)
+        self.load_notes()
+    
+    def on_note_deleted(self, note_id):
+        """Remove a deleted note's row and return to the notes list"""
+        item = self._items.pop(note_id, None)
+        if item is not None:
+            self.notes_list.takeItem(self.notes_list.row(item))
+        
+        if not self._items:
+            self.notes_list.hide()
+            self.empty_label.show()
+        
+        self.stack.setCurrentWidget(self.list_page)
@@ -2,22 +2,265 @@
 Note detail view with audio player and collapsible transcription
 """
 import os
+from contextlib import suppress
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QLabel, QTextEdit, QSlider, QGroupBox, QScrollArea, QFrame, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, 
+    QLabel, QPlainTextEdit, QSlider, QGroupBox, QScrollArea, QFrame, QMessageBox
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QElapsedTimer, QObject, QRunnable, QThreadPool, QSignalBlocker, pyqtSignal
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QFont
 from services.audio_player import AudioPlayer
 
 
+# Playback position refresh interval; the slider and the MM:SS label
+# cannot show anything finer than a few updates per second
+PLAYBACK_REFRESH_MS = 250
+
+
+# Stylesheets for the detail view; the two cards, their titles and the two
+# text views share one constant each instead of repeating the literal
+SECTION_TOGGLE_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.2);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 12px;
+        font-size: 15px;
+        font-weight: bold;
+        text-align: left;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.3);
+    }
+"""
+
+SECTION_CONTENT_STYLE = """
+    QFrame {
+        background: rgba(255, 255, 255, 0.1);
+        border: none;
+        border-radius: 10px;
+        margin-top: 5px;
+    }
+"""
+
+VIEW_STYLE = """
+    QWidget {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 #667eea,
+            stop:1 #764ba2
+        );
+    }
+"""
+
+SCROLL_AREA_STYLE = """
+    QScrollArea {
+        border: none;
+        background: transparent;
+    }
+    QScrollBar:vertical {
+        background: rgba(255, 255, 255, 0.1);
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(255, 255, 255, 0.3);
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: rgba(255, 255, 255, 0.5);
+    }
+"""
+
+BACK_BTN_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.2);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.3);
+    }
+"""
+
+DELETE_BTN_STYLE = """
+    QPushButton {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #ff6b6b,
+            stop:1 #ee5a6f
+        );
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #ee5a6f,
+            stop:1 #ff6b6b
+        );
+    }
+"""
+
+TITLE_STYLE = """
+    font-size: 28px;
+    font-weight: bold;
+    color: white;
+    background: transparent;
+    margin: 10px 0;
+"""
+
+DATE_STYLE = """
+    color: rgba(255, 255, 255, 0.8);
+    font-size: 14px;
+    background: transparent;
+    margin-bottom: 10px;
+"""
+
+CARD_FRAME_STYLE = """
+    QFrame {
+        background: rgba(255, 255, 255, 0.15);
+        border: none;
+        border-radius: 16px;
+        padding: 20px;
+    }
+"""
+
+CARD_TITLE_STYLE = """
+    font-size: 18px;
+    font-weight: bold;
+    color: white;
+    background: transparent;
+"""
+
+PLAY_BTN_STYLE = """
+    QPushButton {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f093fb,
+            stop:1 #f5576c
+        );
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f5576c,
+            stop:1 #f093fb
+        );
+    }
+"""
+
+STOP_BTN_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.2);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.3);
+    }
+"""
+
+DURATION_STYLE = """
+    color: white;
+    font-size: 14px;
+    background: transparent;
+"""
+
+SLIDER_STYLE = """
+    QSlider::groove:horizontal {
+        background: rgba(255, 255, 255, 0.2);
+        height: 8px;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: white;
+        width: 18px;
+        height: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }
+    QSlider::sub-page:horizontal {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4facfe,
+            stop:1 #00f2fe
+        );
+        border-radius: 4px;
+    }
+"""
+
+TEXT_VIEW_STYLE = """
+    QPlainTextEdit {
+        background: rgba(255, 255, 255, 0.9);
+        border: none;
+        border-radius: 10px;
+        padding: 12px;
+        font-size: 14px;
+        color: #333;
+    }
+"""
+
+
+class _DeleteNoteSignals(QObject):
+    """Signals for _DeleteNoteTask"""
+    done = pyqtSignal()
+
+
+class _DeleteNoteTask(QRunnable):
+    """Deletes a note's audio file and stored record on a thread pool worker"""
+    
+    def __init__(self, audio_path, note_id, storage=None):
+        super().__init__()
+        self.audio_path = audio_path
+        self.note_id = note_id
+        self.storage = storage
+        self.signals = _DeleteNoteSignals()
+    
+    def run(self):
+        """Delete the note"""
+        # Delete audio file; a missing file is not an error
+        try:
+            with suppress(FileNotFoundError):
+                os.unlink(self.audio_path)
+        except Exception as e:
+            print(f"Warning: Could not delete audio file: {e}")
+        
+        # Delete note from storage
+        if self.storage is not None:
+            self.storage.delete_note(self.note_id)
+        
+        self.signals.done.emit()
+
+
 class CollapsibleSection(QWidget):
     """A collapsible section widget"""
     
     def __init__(self, title="", parent=None):
         super().__init__(parent)
         self.is_collapsed = True
-        self.animation = None
+        self._content_factory = None
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -25,35 +268,14 @@ class CollapsibleSection(QWidget):
         
         # Toggle button
         self.toggle_btn = QPushButton(f"▼ {title}")
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.2);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                font-size: 15px;
-                font-weight: bold;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.3);
-            }
-        """)
+        self.toggle_btn.setStyleSheet(SECTION_TOGGLE_STYLE)
         self.toggle_btn.clicked.connect(self.toggle)
         layout.addWidget(self.toggle_btn)
         
         # Content area
         self.content_area = QFrame()
-        self.content_area.setMaximumHeight(0)
-        self.content_area.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 10px;
-                margin-top: 5px;
-            }
-        """)
+        self.content_area.setVisible(False)
+        self.content_area.setStyleSheet(SECTION_CONTENT_STYLE)
         
         self.content_layout = QVBoxLayout(self.content_area)
         layout.addWidget(self.content_area)
@@ -61,180 +283,104 @@ class CollapsibleSection(QWidget):
     def set_content(self, widget):
         """Set the content widget"""
         self.content_layout.addWidget(widget)
+    
+    def set_content_factory(self, factory):
+        """Set a callable that builds the content widget on first expand"""
+        self._content_factory = factory
         
     def toggle(self):
         """Toggle collapse/expand"""
-        if self.animation:
-            self.animation.stop()
-            
         self.is_collapsed = not self.is_collapsed
         
+        # Build deferred content the first time the section is opened
+        if not self.is_collapsed and self._content_factory is not None:
+            factory = self._content_factory
+            self._content_factory = None
+            self.set_content(factory())
+        
         if self.is_collapsed:
             self.toggle_btn.setText(self.toggle_btn.text().replace("▲", "▼"))
-            target_height = 0
         else:
             self.toggle_btn.setText(self.toggle_btn.text().replace("▼", "▲"))
-            # Calculate content height
-            target_height = self.content_layout.sizeHint().height() + 20
-        
-        self.animation = QPropertyAnimation(self.content_area, b"maximumHeight")
-        self.animation.setDuration(300)
-        self.animation.setStartValue(self.content_area.maximumHeight())
-        self.animation.setEndValue(target_height)
-        self.animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        self.animation.start()
+        
+        # Showing or hiding relayouts once, instead of on every frame of a
+        # height animation
+        self.content_area.setVisible(not self.is_collapsed)
 
 
 class NoteDetailView(QWidget):
     """View for displaying note details with audio player"""
     
+    noteDeleted = pyqtSignal(str)  # note id
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.note = None
-        self.audio_player = AudioPlayer()
         self.parent_window = parent
+        if parent and hasattr(parent, 'storage'):
+            self.audio_player = AudioPlayer(parent.storage.cache_dir)
+        else:
+            self.audio_player = AudioPlayer()
         self.setup_ui()
         
-        # Timer for updating playback position
-        self.playback_timer = QTimer()
+        # Timer for updating playback position; only runs while playing
+        # and visible
+        self.playback_timer = QTimer(self)
         self.playback_timer.timeout.connect(self.update_playback)
-        self.playback_timer.setInterval(100)  # Update every 100ms
-        self.playback_start_time = 0
+        self.playback_timer.setInterval(PLAYBACK_REFRESH_MS)
+        # Position is the offset at the last play plus monotonic time since
+        self._elapsed = QElapsedTimer()
+        self._paused_at = 0
         self.playback_position = 0
+        self._duration_suffix = " / 00:00"
+        self._last_sec = -1
     
     def setup_ui(self):
         """Setup the user interface"""
         # Gradient background
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #667eea,
-                    stop:1 #764ba2
-                );
-            }
-        """)
+        self.setStyleSheet(VIEW_STYLE)
         
         # Scroll area for content
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-        """)
+        scroll.setStyleSheet(SCROLL_AREA_STYLE)
         
+        # One grid for the whole page: the header buttons share row 0 and
+        # every other block spans both columns
         content = QWidget()
-        layout = QVBoxLayout(content)
+        layout = QGridLayout(content)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
         
-        # Header with back and delete buttons
-        header_layout = QHBoxLayout()
-        
         # Back button
-        back_btn = QPushButton("← Back to Notes")
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.2);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.3);
-            }
-        """)
-        header_layout.addWidget(back_btn)
-        
-        header_layout.addStretch()
+        self.back_btn = QPushButton("← Back to Notes")
+        self.back_btn.setStyleSheet(BACK_BTN_STYLE)
+        layout.addWidget(self.back_btn, 0, 0, Qt.AlignmentFlag.AlignLeft)
         
         # Delete button
         self.delete_btn = QPushButton("🗑️ Delete Note")
         self.delete_btn.clicked.connect(self.delete_note)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #ff6b6b,
-                    stop:1 #ee5a6f
-                );
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #ee5a6f,
-                    stop:1 #ff6b6b
-                );
-            }
-        """)
-        header_layout.addWidget(self.delete_btn)
-        
-        layout.addLayout(header_layout)
+        self.delete_btn.setStyleSheet(DELETE_BTN_STYLE)
+        layout.addWidget(self.delete_btn, 0, 1, Qt.AlignmentFlag.AlignRight)
         
         # Title
         self.title_label = QLabel()
-        self.title_label.setStyleSheet("""
-            font-size: 28px;
-            font-weight: bold;
-            color: white;
-            background: transparent;
-            margin: 10px 0;
-        """)
+        self.title_label.setStyleSheet(TITLE_STYLE)
         self.title_label.setWordWrap(True)
-        layout.addWidget(self.title_label)
+        layout.addWidget(self.title_label, 1, 0, 1, 2)
         
         # Date
         self.date_label = QLabel()
-        self.date_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.8);
-            font-size: 14px;
-            background: transparent;
-            margin-bottom: 10px;
-        """)
-        layout.addWidget(self.date_label)
+        self.date_label.setStyleSheet(DATE_STYLE)
+        layout.addWidget(self.date_label, 2, 0, 1, 2)
         
         # Audio player with modern styling
         player_frame = QFrame()
-        player_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.15);
-                border: none;
-                border-radius: 16px;
-                padding: 20px;
-            }
-        """)
+        player_frame.setStyleSheet(CARD_FRAME_STYLE)
         player_layout = QVBoxLayout(player_frame)
         
         player_title = QLabel("🎵 Audio Player")
-        player_title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: white;
-            background: transparent;
-        """)
+        player_title.setStyleSheet(CARD_TITLE_STYLE)
         player_layout.addWidget(player_title)
         
         # Playback controls
@@ -242,56 +388,18 @@ class NoteDetailView(QWidget):
         
         self.play_btn = QPushButton("▶ Play")
         self.play_btn.clicked.connect(self.toggle_playback)
-        self.play_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #f093fb,
-                    stop:1 #f5576c
-                );
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #f5576c,
-                    stop:1 #f093fb
-                );
-            }
-        """)
+        self.play_btn.setStyleSheet(PLAY_BTN_STYLE)
         controls_layout.addWidget(self.play_btn)
         
         self.stop_btn = QPushButton("⏹ Stop")
         self.stop_btn.clicked.connect(self.stop_playback)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.2);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.3);
-            }
-        """)
+        self.stop_btn.setStyleSheet(STOP_BTN_STYLE)
         controls_layout.addWidget(self.stop_btn)
         
         controls_layout.addStretch()
         
         self.duration_label = QLabel("00:00 / 00:00")
-        self.duration_label.setStyleSheet("""
-            color: white;
-            font-size: 14px;
-            background: transparent;
-        """)
+        self.duration_label.setStyleSheet(DURATION_STYLE)
         controls_layout.addWidget(self.duration_label)
         
         player_layout.addLayout(controls_layout)
@@ -299,91 +407,41 @@ class NoteDetailView(QWidget):
         # Progress slider
         self.progress_slider = QSlider(Qt.Orientation.Horizontal)
         self.progress_slider.setEnabled(False)
-        self.progress_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: rgba(255, 255, 255, 0.2);
-                height: 8px;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: white;
-                width: 18px;
-                height: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }
-            QSlider::sub-page:horizontal {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4facfe,
-                    stop:1 #00f2fe
-                );
-                border-radius: 4px;
-            }
-        """)
+        self.progress_slider.setStyleSheet(SLIDER_STYLE)
         player_layout.addWidget(self.progress_slider)
         
-        layout.addWidget(player_frame)
+        layout.addWidget(player_frame, 3, 0, 1, 2)
         
         # Summary section
         summary_frame = QFrame()
-        summary_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.15);
-                border: none;
-                border-radius: 16px;
-                padding: 20px;
-            }
-        """)
+        summary_frame.setStyleSheet(CARD_FRAME_STYLE)
         summary_layout = QVBoxLayout(summary_frame)
         
         summary_title = QLabel("📝 Summary")
-        summary_title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: white;
-            background: transparent;
-        """)
+        summary_title.setStyleSheet(CARD_TITLE_STYLE)
         summary_layout.addWidget(summary_title)
         
-        self.summary_text = QTextEdit()
+        self.summary_text = QPlainTextEdit()
         self.summary_text.setReadOnly(True)
+        self.summary_text.setUndoRedoEnabled(False)
         self.summary_text.setMinimumHeight(150)
-        self.summary_text.setStyleSheet("""
-            QTextEdit {
-                background: rgba(255, 255, 255, 0.9);
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                font-size: 14px;
-                color: #333;
-            }
-        """)
+        self.summary_text.setStyleSheet(TEXT_VIEW_STYLE)
         summary_layout.addWidget(self.summary_text)
         
-        layout.addWidget(summary_frame)
+        layout.addWidget(summary_frame, 4, 0, 1, 2)
         
         # Collapsible transcription section
         self.transcription_section = CollapsibleSection("📄 Full Transcription")
         
-        self.transcription_text = QTextEdit()
-        self.transcription_text.setReadOnly(True)
-        self.transcription_text.setMinimumHeight(200)
-        self.transcription_text.setStyleSheet("""
-            QTextEdit {
-                background: rgba(255, 255, 255, 0.9);
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                font-size: 14px;
-                color: #333;
-            }
-        """)
-        self.transcription_section.set_content(self.transcription_text)
-        
-        layout.addWidget(self.transcription_section)
-        
-        layout.addStretch()
+        # The transcription can be long and is often never opened, so its
+        # text view is only built on first expand
+        self.transcription_text = None
+        self._pending_transcription = ""
+        self.transcription_section.set_content_factory(self._build_transcription_text)
+        
+        layout.addWidget(self.transcription_section, 5, 0, 1, 2)
+        
+        layout.setRowStretch(6, 1)
         
         scroll.setWidget(content)
         
@@ -391,24 +449,50 @@ class NoteDetailView(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll)
     
+    def _build_transcription_text(self):
+        """Create the transcription text view and fill it with the current note"""
+        self.transcription_text = QPlainTextEdit()
+        self.transcription_text.setReadOnly(True)
+        self.transcription_text.setUndoRedoEnabled(False)
+        self.transcription_text.setMinimumHeight(200)
+        self.transcription_text.setStyleSheet(TEXT_VIEW_STYLE)
+        self.transcription_text.setPlainText(self._pending_transcription)
+        return self.transcription_text
+    
     def load_note(self, note):
         """Load a note into the view"""
+        previous = self.note
         self.note = note
         
+        # Reopening the same note keeps its text documents instead of
+        # rebuilding them
+        same_note = previous is not None and previous.id == note.id
+        
         # Update UI
         self.title_label.setText(note.title)
         self.date_label.setText(f"Created: {note.created_at}")
-        self.summary_text.setPlainText(note.summary)
-        self.transcription_text.setPlainText(note.transcription)
+        if not (same_note and previous.summary == note.summary):
+            self.summary_text.setPlainText(note.summary)
+        if not (same_note and previous.transcription == note.transcription):
+            self._pending_transcription = note.transcription
+            if self.transcription_text is not None:
+                self.transcription_text.setPlainText(note.transcription)
         
         # Load audio
         try:
             self.audio_player.load(note.audio_path)
             duration_mins = int(note.duration // 60)
             duration_secs = int(note.duration % 60)
-            self.duration_label.setText(f"00:00 / {duration_mins:02d}:{duration_secs:02d}")
-            self.progress_slider.setMaximum(int(note.duration * 10))  # 10 updates per second
-            self.progress_slider.setValue(0)
+            # The total never changes while the note is open
+            self._duration_suffix = f" / {duration_mins:02d}:{duration_secs:02d}"
+            self._last_sec = 0
+            self.duration_label.setText(f"00:00{self._duration_suffix}")
+            # Programmatic updates must not look like user seeks
+            with QSignalBlocker(self.progress_slider):
+                maximum = int(note.duration * 10)  # Slider steps of 0.1 s
+                if self.progress_slider.maximum() != maximum:
+                    self.progress_slider.setMaximum(maximum)
+                self.progress_slider.setValue(0)
         except Exception as e:
             self.duration_label.setText(f"Error loading audio: {str(e)}")
     
@@ -419,11 +503,12 @@ class NoteDetailView(QWidget):
                 self.audio_player.pause()
                 self.play_btn.setText("▶ Play")
                 self.playback_timer.stop()
+                self.playback_position = self._paused_at + self._elapsed.elapsed() / 1000.0
             else:
-                import time
                 self.audio_player.play()
                 self.play_btn.setText("⏸ Pause")
-                self.playback_start_time = time.time() - self.playback_position
+                self._paused_at = self.playback_position
+                self._elapsed.restart()
                 self.playback_timer.start()
         except Exception as e:
             print(f"Playback error: {e}")
@@ -437,39 +522,44 @@ class NoteDetailView(QWidget):
         self.play_btn.setText("▶ Play")
         self.playback_timer.stop()
         self.playback_position = 0
-        self.progress_slider.setValue(0)
+        with QSignalBlocker(self.progress_slider):
+            self.progress_slider.setValue(0)
         if self.note:
-            duration_mins = int(self.note.duration // 60)
-            duration_secs = int(self.note.duration % 60)
-            self.duration_label.setText(f"00:00 / {duration_mins:02d}:{duration_secs:02d}")
+            self._last_sec = 0
+            self.duration_label.setText(f"00:00{self._duration_suffix}")
     
     def update_playback(self):
         """Update playback position"""
+        # Nothing to repaint while the view is hidden
+        if not self.isVisible():
+            return
+        
         if not self.audio_player.is_busy():
             # Playback finished
             self.stop_playback()
             return
         
-        if not self.note:
+        note = self.note
+        if not note:
             return
         
-        # Calculate current position based on elapsed time
-        import time
-        self.playback_position = time.time() - self.playback_start_time
-        
-        # Clamp to duration
-        if self.playback_position > self.note.duration:
-            self.playback_position = self.note.duration
+        # Calculate current position based on elapsed time, clamped to duration
+        pos = self._paused_at + self._elapsed.elapsed() / 1000.0
+        duration = note.duration
+        if pos > duration:
+            pos = duration
+        self.playback_position = pos
         
         # Update slider
-        self.progress_slider.setValue(int(self.playback_position * 10))
-        
-        # Update time label
-        current_mins = int(self.playback_position // 60)
-        current_secs = int(self.playback_position % 60)
-        duration_mins = int(self.note.duration // 60)
-        duration_secs = int(self.note.duration % 60)
-        self.duration_label.setText(f"{current_mins:02d}:{current_secs:02d} / {duration_mins:02d}:{duration_secs:02d}")
+        slider = self.progress_slider
+        with QSignalBlocker(slider):
+            slider.setValue(int(pos * 10))
+        
+        # Update time label, only when the displayed second changes
+        sec = int(pos)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self.duration_label.setText(f"{sec // 60:02d}:{sec % 60:02d}{self._duration_suffix}")
     
     def hideEvent(self, event):
         """Stop playback when view is hidden"""
@@ -494,26 +584,31 @@ class NoteDetailView(QWidget):
             # Stop playback
             self.stop_playback()
             
-            # Delete audio file if it exists
-            if os.path.exists(self.note.audio_path):
-                try:
-                    os.remove(self.note.audio_path)
-                except Exception as e:
-                    print(f"Warning: Could not delete audio file: {e}")
+            has_storage = self.parent_window and hasattr(self.parent_window, 'storage')
             
-            # Delete note from storage
-            if self.parent_window and hasattr(self.parent_window, 'storage'):
-                self.parent_window.storage.delete_note(self.note.id)
-                
-                # Go back to main window
-                self.hide()
-                central_widget = QWidget()
-                self.parent_window.setCentralWidget(central_widget)
-                self.parent_window.setup_ui()
-                self.parent_window.load_notes()
-                
-                QMessageBox.information(
-                    self.parent_window,
-                    'Note Deleted',
-                    'The note has been successfully deleted.'
-                )
+            # Hide the note right away so a list reload cannot bring it back
+            # before the worker has written the deletion
+            if has_storage:
+                self.parent_window.storage.forget_note(self.note.id)
+            
+            # Delete the audio file and stored note without blocking the UI
+            self._delete_task = _DeleteNoteTask(
+                self.note.audio_path,
+                self.note.id,
+                self.parent_window.storage if has_storage else None
+            )
+            if has_storage:
+                self._delete_task.signals.done.connect(self.on_note_delete_done)
+            QThreadPool.globalInstance().start(self._delete_task)
+            
+            if has_storage:
+                # Let the notes list drop the row and take over
+                self.noteDeleted.emit(self.note.id)
+    
+    def on_note_delete_done(self):
+        """Confirm that the note has been deleted"""
+        QMessageBox.information(
+            self.parent_window,
+            'Note Deleted',
+            'The note has been successfully deleted.'
+        )